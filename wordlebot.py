@@ -4,14 +4,16 @@
 # Players have to guess a 5-letter word within 6 attempts, receiving feedback on the correctness of each letter.
 # The feedback consists of 'G' (correct letter and position), 'Y' (correct letter but wrong position), and 'B' (incorrect letter).
 # The bot uses a grid to track possible letters for each position in the word, applying constraints based on feedback. 
-# It ranks words by summing letter frequency scores based on a predefined cryptography letter distribution.
+# It ranks the remaining candidates by the entropy of the feedback they would produce, breaking ties by
+# summing letter frequency scores based on a predefined cryptography letter distribution.
 
 import numpy as np
-import pandas as pd
+import os
 import random
+import tempfile
 import time
-from collections import Counter
-from typing import List, Dict, Set, Optional
+from numba import njit, prange
+from typing import List, Dict, Set, Optional, Tuple
 
 # Cryptography Letter Frequency Distribution
 LETTER_DISTRIBUTION = {
@@ -21,6 +23,516 @@ LETTER_DISTRIBUTION = {
     'Y': 2.0, 'Z': 0.1
 }
 
+WORDS_PATH: str = "data/possible_words.txt"
+WORDS_CACHE_PATH: str = "data/possible_words.npy"
+
+# Feedback marks, packed into a base-3 code with the first letter as the most significant digit
+GREEN: int = 0
+YELLOW: int = 1
+BLACK: int = 2
+FEEDBACK_SYMBOLS: str = "GYB"
+ALL_GREEN: int = 0
+ALL_BLACK: int = 3 ** 5 - 1
+MAX_ATTEMPTS: int = 6
+
+def read_word_list(path: str = WORDS_PATH) -> np.ndarray:
+    """
+    Parse the text word list into an array of fixed-width byte strings.
+
+    Args:
+        path (str): Path to the word list, one word per line.
+
+    Returns:
+        np.ndarray: S5 array of the words in the dataset.
+
+    Raises:
+        ValueError: If any line is not a 5-letter lowercase word.
+    """
+    with open(path) as f:
+        words_list: List[str] = [line.strip() for line in f if line.strip()]
+    invalid: List[str] = [w for w in words_list if len(w) != 5 or not (w.isascii() and w.isalpha() and w.islower())]
+    if invalid:
+        raise ValueError(f"{path} must contain only 5-letter lowercase words, found: {invalid[:5]}")
+    return np.array(words_list, dtype="S5")
+
+def build_word_cache(path: str = WORDS_PATH, cache_path: str = WORDS_CACHE_PATH) -> np.ndarray:
+    """
+    Save the word list as a binary array of fixed-width byte strings.
+
+    The cache is written to a temporary file and moved into place, so a concurrent reader never
+    sees a partially written cache.
+
+    Args:
+        path (str): Path to the word list, one word per line.
+        cache_path (str): Path of the .npy cache to write.
+
+    Returns:
+        np.ndarray: S5 array of the words in the dataset.
+    """
+    words: np.ndarray = read_word_list(path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, words)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return words
+
+def load_words(path: str = WORDS_PATH, cache_path: str = WORDS_CACHE_PATH) -> np.ndarray:
+    """
+    Load the word dataset, memory-mapping its binary cache and rebuilding it if the word list is newer.
+
+    If the cache cannot be written (e.g. a read-only data directory), the text list is parsed instead.
+
+    Args:
+        path (str): Path to the word list, one word per line.
+        cache_path (str): Path of the .npy cache.
+
+    Returns:
+        np.ndarray: S5 array of the words in the dataset.
+    """
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(path):
+        try:
+            build_word_cache(path, cache_path)
+        except OSError:
+            return read_word_list(path)
+    return np.load(cache_path, mmap_mode="r")
+
+def encode_word(word: str) -> np.ndarray:
+    """
+    Encode a word as letter indices (a=0, ..., z=25).
+
+    Args:
+        word (str): The word to encode.
+
+    Returns:
+        np.ndarray: uint8 array of letter indices.
+    """
+    return np.frombuffer(word.encode("ascii"), dtype=np.uint8) - ord('a')
+
+def feedback_marks(code: int) -> np.ndarray:
+    """
+    Unpack a feedback code into per-position marks.
+
+    Args:
+        code (int): Base-3 feedback code.
+
+    Returns:
+        np.ndarray: uint8 array of GREEN, YELLOW or BLACK marks.
+    """
+    marks: np.ndarray = np.empty(5, dtype=np.uint8)
+    for i in range(4, -1, -1):
+        code, marks[i] = divmod(int(code), 3)
+    return marks
+
+def decode_feedback(code: int) -> str:
+    """
+    Decode a packed feedback code into its 'G', 'Y', 'B' string.
+
+    Args:
+        code (int): Base-3 feedback code.
+
+    Returns:
+        str: Feedback string composed of 'G', 'Y', and 'B'.
+    """
+    return "".join(FEEDBACK_SYMBOLS[mark] for mark in feedback_marks(code))
+
+# Each word is packed into a uint64, one 5-bit letter index per byte
+BYTE_LSBS: np.uint64 = np.uint64(0x0101010101)
+LETTER_BITS: np.uint64 = np.uint64(0x1F)
+
+def pack_word(word: str) -> np.uint64:
+    """
+    Pack a word into a uint64 with the letter index of position i in byte i.
+
+    Args:
+        word (str): The word to pack.
+
+    Returns:
+        np.uint64: The packed word.
+    """
+    codes: np.ndarray = encode_word(word).astype(np.uint64)
+    return np.bitwise_or.reduce(codes << (np.uint64(8) * np.arange(len(word), dtype=np.uint64)))
+
+def letter_counts(word: str) -> np.ndarray:
+    """
+    Count the occurrences of each letter in a word.
+
+    Args:
+        word (str): The word.
+
+    Returns:
+        np.ndarray: (26,) uint8 array of letter counts.
+    """
+    return np.bincount(encode_word(word), minlength=26).astype(np.uint8)
+
+def letter_mask(word: str) -> np.uint32:
+    """
+    Build the 26-bit presence mask of the letters in a word.
+
+    Args:
+        word (str): The word.
+
+    Returns:
+        np.uint32: Mask with bit i set if letter i occurs in the word.
+    """
+    return np.bitwise_or.reduce(np.uint32(1) << encode_word(word).astype(np.uint32))
+
+@njit(cache=True)
+def feedback_code(guess: np.uint64, answer: np.uint64) -> int:
+    """
+    Compute the feedback code for a packed guess against a packed answer.
+
+    Args:
+        guess (np.uint64): The packed guessed word.
+        answer (np.uint64): The packed target word.
+
+    Returns:
+        int: Base-3 feedback code.
+    """
+    # Greens: a byte of guess ^ answer is zero exactly where the letters match
+    diff = guess ^ answer
+    nonzero = (diff | (diff >> np.uint64(1)) | (diff >> np.uint64(2)) | (diff >> np.uint64(3)) | (diff >> np.uint64(4))) & BYTE_LSBS
+    greens = ~nonzero & BYTE_LSBS
+
+    code = 0
+    for i in range(5):
+        shift = np.uint64(8 * i)
+        if (greens >> shift) & np.uint64(1):
+            code = code * 3 + GREEN
+            continue
+
+        # Yellow while this letter still has unmatched, non-green occurrences in the answer
+        letter = (guess >> shift) & LETTER_BITS
+        available = 0
+        for j in range(5):
+            shift_j = np.uint64(8 * j)
+            if not ((greens >> shift_j) & np.uint64(1)) and ((answer >> shift_j) & LETTER_BITS) == letter:
+                available += 1
+        claimed = 0
+        for k in range(i):
+            shift_k = np.uint64(8 * k)
+            if not ((greens >> shift_k) & np.uint64(1)) and ((guess >> shift_k) & LETTER_BITS) == letter:
+                claimed += 1
+        code = code * 3 + (YELLOW if claimed < available else BLACK)
+    return code
+
+@njit(parallel=True, cache=True)
+def build_feedback_table(packed: np.ndarray, letters: np.ndarray) -> np.ndarray:
+    """
+    Build the feedback table for every (guess, answer) pair of packed words.
+
+    Args:
+        packed (np.ndarray): (N,) uint64 array of packed words.
+        letters (np.ndarray): (N,) uint32 array of letter presence masks.
+
+    Returns:
+        np.ndarray: (N, N) uint8 array where [g, a] is the feedback code of guess g against answer a.
+    """
+    n = packed.shape[0]
+    table = np.empty((n, n), dtype=np.uint8)
+    for g in prange(n):
+        for a in range(n):
+            if letters[g] & letters[a]:
+                table[g, a] = feedback_code(packed[g], packed[a])
+            else:
+                table[g, a] = ALL_BLACK
+    return table
+
+@njit(cache=True)
+def build_feedback_row(guess: np.uint64, guess_letters: np.uint32, packed: np.ndarray, letters: np.ndarray) -> np.ndarray:
+    """
+    Build the feedback codes of one packed guess against every packed word.
+
+    Args:
+        guess (np.uint64): The packed guessed word.
+        guess_letters (np.uint32): Letter presence mask of the guessed word.
+        packed (np.ndarray): (N,) uint64 array of packed words.
+        letters (np.ndarray): (N,) uint32 array of letter presence masks.
+
+    Returns:
+        np.ndarray: (N,) uint8 array of feedback codes.
+    """
+    n = packed.shape[0]
+    row = np.empty(n, dtype=np.uint8)
+    for a in range(n):
+        if guess_letters & letters[a]:
+            row[a] = feedback_code(guess, packed[a])
+        else:
+            row[a] = ALL_BLACK
+    return row
+
+@njit(cache=True)
+def propagate(cells: np.ndarray, letter_min_count: np.ndarray, letter_max_count: np.ndarray,
+              guess: np.ndarray, guess_letter_count: np.ndarray, marks: np.ndarray) -> None:
+    """
+    Update letter domains and count constraints in place from an encoded guess and its feedback.
+
+    Args:
+        cells (np.ndarray): (5, 26) bool domains, [i, c] set if letter c is still allowed at position i.
+        letter_min_count (np.ndarray): (26,) uint8 minimum occurrences required for each letter.
+        letter_max_count (np.ndarray): (26,) uint8 maximum occurrences allowed for each letter.
+        guess (np.ndarray): Letter indices of the guessed word.
+        guess_letter_count (np.ndarray): (26,) letter counts of the guessed word.
+        marks (np.ndarray): Feedback mark (GREEN, YELLOW or BLACK) of each position.
+    """
+    width = guess.shape[0]
+    green_yellow_count = np.zeros(26, dtype=np.uint8)
+
+    # First, record greens and yellows to update min counts
+    for i in range(width):
+        if marks[i] != BLACK:
+            green_yellow_count[guess[i]] += 1
+
+    # Update minimum count of letters that appear as green or yellow
+    for ch in range(26):
+        if green_yellow_count[ch] > letter_min_count[ch]:
+            letter_min_count[ch] = green_yellow_count[ch]
+
+    # Handle Greens: Fix letter in that position
+    for i in range(width):
+        if marks[i] == GREEN:
+            cells[i, :] = False
+            cells[i, guess[i]] = True
+
+    # Handle Yellows: Letter is in the word but not in this position
+    for i in range(width):
+        if marks[i] == YELLOW:
+            cells[i, guess[i]] = False
+
+    # Handle Blacks: The letter is not in the word at this frequency.
+    for i in range(width):
+        ch = guess[i]
+        if marks[i] == BLACK and green_yellow_count[ch] < guess_letter_count[ch]:
+            letter_max_count[ch] = min(letter_max_count[ch], green_yellow_count[ch])
+            for pos in range(width):
+                if cells[pos].sum() > 1:
+                    cells[pos, ch] = False
+
+@njit(cache=True)
+def guess_entropies(table: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Compute the entropy of the feedback pattern distribution for each candidate used as the guess.
+
+    Args:
+        table (np.ndarray): (N, N) feedback table.
+        candidates (np.ndarray): Indices of the words still consistent with all feedback.
+
+    Returns:
+        np.ndarray: Entropy (in nats) of each candidate's pattern distribution over the candidates.
+    """
+    n = candidates.shape[0]
+    entropies = np.empty(n, dtype=np.float64)
+    counts = np.empty(ALL_BLACK + 1, dtype=np.int64)
+    for i in range(n):
+        counts[:] = 0
+        row = table[candidates[i]]
+        for j in range(n):
+            counts[row[candidates[j]]] += 1
+        entropy = 0.0
+        for count in counts:
+            if count > 0:
+                p = count / n
+                entropy -= p * np.log(p)
+        entropies[i] = entropy
+    return entropies
+
+# Words stay as the (memory-mapped) S5 array and are only decoded to str where a str is needed
+_ALLOWED_WORDS: np.ndarray = load_words()
+_WORD_INDEX: Dict[str, int] = {w.decode("ascii"): i for i, w in enumerate(_ALLOWED_WORDS)}
+_WORD_CODES: np.ndarray = _ALLOWED_WORDS.view(np.uint8).reshape(-1, 5) - ord('a')
+_PACKED_WORDS: np.ndarray = np.bitwise_or.reduce(
+    _WORD_CODES.astype(np.uint64) << (np.uint64(8) * np.arange(5, dtype=np.uint64)), axis=1
+)
+_LETTER_MASKS: np.ndarray = np.bitwise_or.reduce(np.uint32(1) << _WORD_CODES.astype(np.uint32), axis=1)
+FEEDBACK_TABLE: np.ndarray = build_feedback_table(_PACKED_WORDS, _LETTER_MASKS)
+_EXTRA_ROWS: Dict[str, np.ndarray] = {}
+_LETTER_COUNTS: np.ndarray = np.zeros((len(_ALLOWED_WORDS), 26), dtype=np.uint8)
+np.add.at(_LETTER_COUNTS, (np.arange(len(_ALLOWED_WORDS))[:, None], _WORD_CODES), 1)
+# Letter frequency score of each word, counting each distinct letter once
+_LETTER_WEIGHTS: np.ndarray = np.array([LETTER_DISTRIBUTION.get(chr(ord('A') + i), 0) for i in range(26)])
+_WORD_SCORES: np.ndarray = (_LETTER_COUNTS > 0) @ _LETTER_WEIGHTS
+
+def word_at(idx: int) -> str:
+    """
+    Get a word of the dataset by index.
+
+    Args:
+        idx (int): Index of the word.
+
+    Returns:
+        str: The word.
+    """
+    return _ALLOWED_WORDS[idx].decode("ascii")
+
+def feedback_row(guess: str) -> np.ndarray:
+    """
+    Get the feedback codes of a guess against every word in the dataset.
+
+    Args:
+        guess (str): The guessed word.
+
+    Returns:
+        np.ndarray: (N,) uint8 array of feedback codes.
+    """
+    guess_idx: Optional[int] = _WORD_INDEX.get(guess)
+    if guess_idx is not None:
+        return FEEDBACK_TABLE[guess_idx]
+    # Guesses outside the dataset (i.e. the opening) get their row computed once
+    row: Optional[np.ndarray] = _EXTRA_ROWS.get(guess)
+    if row is None:
+        row = build_feedback_row(pack_word(guess), letter_mask(guess), _PACKED_WORDS, _LETTER_MASKS)
+        _EXTRA_ROWS[guess] = row
+    return row
+
+def word_feedback(guess: str, word: str) -> int:
+    """
+    Compute the feedback code of a single guess against a word outside the dataset.
+
+    Args:
+        guess (str): The guessed word.
+        word (str): The target word.
+
+    Returns:
+        int: Base-3 feedback code.
+    """
+    guess_codes: np.ndarray = encode_word(guess)
+    word_codes: np.ndarray = encode_word(word)
+    greens: np.ndarray = guess_codes == word_codes
+    # Occurrences of each letter left to match as yellow once greens are taken out
+    remaining: np.ndarray = np.bincount(word_codes[~greens], minlength=26)
+
+    code: int = 0
+    for letter, green in zip(guess_codes.tolist(), greens.tolist()):
+        if green:
+            mark: int = GREEN
+        elif remaining[letter] > 0:
+            remaining[letter] -= 1
+            mark = YELLOW
+        else:
+            mark = BLACK
+        code = code * 3 + mark
+    return code
+
+@njit(cache=True)
+def best_candidate(table: np.ndarray, candidates: np.ndarray, scores: np.ndarray) -> int:
+    """
+    Choose the candidate whose feedback is expected to be most informative.
+
+    Candidates are ranked by the entropy of the feedback patterns they would produce against
+    the other candidates, with ties broken by letter frequency score.
+
+    Args:
+        table (np.ndarray): (N, N) feedback table.
+        candidates (np.ndarray): Indices of the words still consistent with all feedback.
+        scores (np.ndarray): (N,) letter frequency score of each word.
+
+    Returns:
+        int: Index of the chosen guess.
+    """
+    if candidates.shape[0] == 1:
+        return candidates[0]
+    entropies = guess_entropies(table, candidates)
+    best = candidates[0]
+    best_entropy = -1.0
+    for i in range(candidates.shape[0]):
+        # Round so that equal partitions summed in a different order still tie
+        entropy = round(entropies[i], 9)
+        if entropy > best_entropy or (entropy == best_entropy and scores[candidates[i]] > scores[best]):
+            best = candidates[i]
+            best_entropy = entropy
+    return best
+
+def best_guess(mask: np.ndarray) -> str:
+    """
+    Choose the remaining candidate whose feedback is expected to be most informative.
+
+    Args:
+        mask (np.ndarray): Boolean mask of the words still consistent with all feedback.
+
+    Returns:
+        str: The chosen guess.
+    """
+    return word_at(best_candidate(FEEDBACK_TABLE, np.flatnonzero(mask), _WORD_SCORES))
+
+def build_opening_book(opening: str) -> Dict[int, Tuple[str, np.ndarray]]:
+    """
+    Precompute the second turn for every feedback the opening guess can receive.
+
+    Args:
+        opening (str): The fixed first guess.
+
+    Returns:
+        Dict[int, Tuple[str, np.ndarray]]: Maps each feedback code to the next guess and the candidate mask.
+    """
+    patterns: np.ndarray = feedback_row(opening)
+    book: Dict[int, Tuple[str, np.ndarray]] = {}
+    for code in np.unique(patterns):
+        mask: np.ndarray = patterns == code
+        book[int(code)] = (best_guess(mask), mask)
+    return book
+
+OPENING_GUESS: str = "salet"
+_OPENING_BOOK: Dict[int, Tuple[str, np.ndarray]] = build_opening_book(OPENING_GUESS)
+
+@njit(parallel=True, cache=True)
+def simulate_all(table: np.ndarray, scores: np.ndarray, opening_row: np.ndarray, opening_replies: np.ndarray) -> np.ndarray:
+    """
+    Play a game for every word in the dataset, using only word indices and the feedback table.
+
+    Follows the same strategy as WordleBot.play: the fixed opening, the precomputed reply, then
+    the best remaining candidate each turn.
+
+    Args:
+        table (np.ndarray): (N, N) feedback table.
+        scores (np.ndarray): (N,) letter frequency score of each word.
+        opening_row (np.ndarray): (N,) feedback codes of the opening guess against every word.
+        opening_replies (np.ndarray): (3^5,) index of the second guess for each opening feedback code.
+
+    Returns:
+        np.ndarray: (N,) number of attempts used for each target word (or 7 if failed).
+    """
+    n = table.shape[0]
+    results = np.empty(n, dtype=np.int8)
+    for a in prange(n):
+        code = opening_row[a]
+        if code == ALL_GREEN:
+            results[a] = 1
+            continue
+        candidates = np.flatnonzero(opening_row == code)
+        guess = opening_replies[code]
+        attempts = 1
+        results[a] = MAX_ATTEMPTS + 1
+        while attempts < MAX_ATTEMPTS:
+            attempts += 1
+            code = table[guess, a]
+            if code == ALL_GREEN:
+                results[a] = attempts
+                break
+            candidates = candidates[table[guess, candidates] == code]
+            if candidates.shape[0] == 0:
+                break
+            guess = best_candidate(table, candidates, scores)
+    return results
+
+def word_letter_counts(word: str) -> np.ndarray:
+    """
+    Get the letter counts of a word, from the precomputed table when the word is in the dataset.
+
+    Args:
+        word (str): The word.
+
+    Returns:
+        np.ndarray: (26,) uint8 array of letter counts.
+    """
+    word_idx: Optional[int] = _WORD_INDEX.get(word)
+    if word_idx is not None:
+        return _LETTER_COUNTS[word_idx]
+    return letter_counts(word)
+
 class Grid:
     def __init__(self, word: Optional[str] = None) -> None:
         """
@@ -29,23 +541,21 @@ class Grid:
         Args:
             word (Optional[str]): The target word for the game. If None, a random word from the dataset is selected.
         """
-        self._complete_domain: Set[str] = set("abcdefghijklmnopqrstuvwxyz")
         self._width: int = 5
-        self._cells: List[Set[str]] = [self._complete_domain.copy() for _ in range(self._width)]
+        self._cells: np.ndarray = np.ones((self._width, 26), dtype=bool)  # [i, c] set = letter c allowed at position i
 
-        # Letter count constraints
-        self.letter_min_count: Counter[str] = Counter()  # minimum occurrences required
-        self.letter_max_count: Counter[str] = Counter({char: 5 for char in self._complete_domain})  # maximum occurrences allowed
+        # Letter count constraints, indexed by letter (a=0, ..., z=25)
+        self.letter_min_count: np.ndarray = np.zeros(26, dtype=np.uint8)  # minimum occurrences required
+        self.letter_max_count: np.ndarray = np.full(26, self._width, dtype=np.uint8)  # maximum occurrences allowed
 
-        # Read dataset
-        df = pd.read_csv("data/possible_words.txt", header=None)
-        words_list: List[str] = [str(w).strip() for w in df[0].values]
-        self.allowed_words: np.ndarray = np.array(words_list, dtype=str)
+        # Candidates are a mask over the dataset, which is loaded once at import and never copied
+        self.mask: np.ndarray = np.ones(len(_ALLOWED_WORDS), dtype=bool)  # candidates still consistent with all feedback
 
         if word is not None:
             self.word: str = word
         else:
-            self.word: str = random.choice(self.allowed_words)
+            self.word: str = word_at(random.randrange(len(_ALLOWED_WORDS)))
+        self.word_idx: Optional[int] = _WORD_INDEX.get(self.word)
 
     def get_cells(self) -> List[Set[str]]:
         """
@@ -54,18 +564,26 @@ class Grid:
         Returns:
             List[Set[str]]: A list of sets representing the possible letters for each position.
         """
-        return self._cells
+        return [{chr(ord('a') + c) for c in np.flatnonzero(cell)} for cell in self._cells]
+
+    def get_allowed_words(self) -> np.ndarray:
+        """
+        Get the words still consistent with all feedback.
+
+        Returns:
+            np.ndarray: Array of the remaining candidate words.
+        """
+        return np.char.decode(_ALLOWED_WORDS[self.mask], "ascii")
 
     def print_domains(self) -> None:
         """
         Print the current domains of each position in the grid, along with letter count constraints.
         """
-        for i, domain in enumerate(self._cells):
+        for i, domain in enumerate(self.get_cells()):
             print(f"Position {i+1}: {sorted(domain)}")
-        if self.letter_min_count:
-            print("Minimum required occurrences:", dict(self.letter_min_count))
-        if self.letter_max_count:
-            print("Maximum allowed occurrences:", {k: v for k, v in self.letter_max_count.items() if v < 5})
+        if self.letter_min_count.any():
+            print("Minimum required occurrences:", {chr(ord('a') + i): int(n) for i, n in enumerate(self.letter_min_count) if n > 0})
+        print("Maximum allowed occurrences:", {chr(ord('a') + i): int(n) for i, n in enumerate(self.letter_max_count) if n < self._width})
 
     def is_solved(self) -> bool:
         """
@@ -74,9 +592,9 @@ class Grid:
         Returns:
             bool: True if the grid is solved, False otherwise.
         """
-        return all(len(cell) == 1 for cell in self._cells)
+        return bool((self._cells.sum(axis=1) == 1).all())
 
-    def feedback(self, guess: str) -> str:
+    def feedback(self, guess: str) -> int:
         """
         Generate feedback for a guess word against the target word.
 
@@ -84,128 +602,53 @@ class Grid:
             guess (str): The guessed word.
 
         Returns:
-            str: Feedback string composed of 'G', 'Y', and 'B' representing Green, Yellow, and Black.
+            int: Base-3 feedback code of the Green, Yellow and Black marks (see decode_feedback).
         """
-        feedback: List[str] = [""] * self._width
-        used_positions: List[bool] = [False] * self._width
-
-        # Greens
-        for i in range(self._width):
-            if guess[i] == self.word[i]:
-                feedback[i] = 'G'
-                used_positions[i] = True
-
-        # Yellows and Blacks
-        for i in range(self._width):
-            if feedback[i] == "":
-                letter: str = guess[i]
-                placed: bool = False
-                for j in range(self._width):
-                    if self.word[j] == letter and not used_positions[j]:
-                        feedback[i] = 'Y'
-                        used_positions[j] = True
-                        placed = True
-                        break
-                if not placed:
-                    feedback[i] = 'B'
-
-        return "".join(feedback)
-
-    def propagate_constraints(self, guess: str, feedback: str) -> None:
+        if self.word_idx is not None:
+            return int(feedback_row(guess)[self.word_idx])
+        return word_feedback(guess, self.word)
+
+    def propagate_constraints(self, guess: str, feedback: int) -> None:
         """
         Update the grid constraints based on the guess and feedback.
 
         Args:
             guess (str): The guessed word.
-            feedback (str): Feedback string of 'G', 'Y', 'B' characters.
+            feedback (int): Base-3 feedback code.
         """
-        guess_letter_count: Counter[str] = Counter(guess)
-        green_yellow_count: Counter[str] = Counter()
-
-        # First, record greens and yellows to update min counts
-        for fb, ch in zip(feedback, guess):
-            if fb == 'G' or fb == 'Y':
-                green_yellow_count[ch] += 1
-
-        # Update minimum count of letters that appear as green or yellow
-        for ch, cnt in green_yellow_count.items():
-            if cnt > self.letter_min_count[ch]:
-                self.letter_min_count[ch] = cnt
-
-        # Handle Greens: Fix letter in that position
-        for i, (char, fb) in enumerate(zip(guess, feedback)):
-            if fb == 'G':
-                self._cells[i] = {char}
-
-        # Handle Yellows: Letter is in the word but not in this position
-        for i, (char, fb) in enumerate(zip(guess, feedback)):
-            if fb == 'Y':
-                if char in self._cells[i]:
-                    self._cells[i].discard(char)
-
-        # Handle Blacks: The letter is not in the word at this frequency.
-        for i, (char, fb) in enumerate(zip(guess, feedback)):
-            if fb == 'B':
-                if green_yellow_count[char] < guess_letter_count[char]:
-                    self.letter_max_count[char] = min(self.letter_max_count[char], green_yellow_count[char])
-                    for pos in range(self._width):
-                        if len(self._cells[pos]) > 1:
-                            self._cells[pos].discard(char)
-
-    def prune_words(self) -> None:
+        propagate(self._cells, self.letter_min_count, self.letter_max_count,
+                  encode_word(guess), word_letter_counts(guess), feedback_marks(feedback))
+
+    def prune_words(self, guess: str, feedback: int) -> None:
         """
-        Prune the list of allowed words based on current grid constraints.
+        Prune the allowed words to those that would have produced the same feedback for the guess.
+
+        Args:
+            guess (str): The guessed word.
+            feedback (int): Base-3 feedback code.
         """
-        possible_words: List[str] = []
-        for word in self.allowed_words:
-            valid: bool = True
-
-            # Check positional domains
-            for i, domain in enumerate(self._cells):
-                if word[i] not in domain:
-                    valid = False
-                    break
-
-            # Check letter min/max counts
-            if valid:
-                word_letter_count: Counter[str] = Counter(word)
-
-                for ch, cnt in self.letter_min_count.items():
-                    if word_letter_count[ch] < cnt:
-                        valid = False
-                        break
-
-                if valid:
-                    for ch, mx in self.letter_max_count.items():
-                        if word_letter_count[ch] > mx:
-                            valid = False
-                            break
-
-            if valid:
-                possible_words.append(word)
-        self.allowed_words = np.array(possible_words)
+        self.mask &= feedback_row(guess) == feedback
 
-class WordleBot:
-    def __init__(self, target_word: Optional[str] = None) -> None:
+    def set_candidates(self, mask: np.ndarray) -> None:
         """
-        Initialize the WordleBot with a target word and associated grid.
+        Replace the allowed words with a precomputed candidate mask.
 
         Args:
-            target_word (Optional[str]): The target word for the game. Defaults to None.
+            mask (np.ndarray): Boolean mask of the words still consistent with all feedback.
         """
-        self.grid: Grid = Grid(word=target_word)
+        self.mask = mask.copy()
 
-    def rank_guess(self, word: str) -> float:
+class WordleBot:
+    def __init__(self, target_word: Optional[str] = None, verbose: bool = False) -> None:
         """
-        Rank a guess based on predefined letter frequencies.
+        Initialize the WordleBot with a target word and associated grid.
 
         Args:
-            word (str): The guessed word.
-
-        Returns:
-            float: The score of the guessed word based on letter frequencies.
+            target_word (Optional[str]): The target word for the game. Defaults to None.
+            verbose (bool): Whether to print the grid state, guesses and feedback while playing. Defaults to False.
         """
-        return sum(LETTER_DISTRIBUTION.get(c.upper(), 0) for c in set(word))
+        self.grid: Grid = Grid(word=target_word)
+        self.verbose: bool = verbose
 
     def play(self) -> int:
         """
@@ -214,72 +657,94 @@ class WordleBot:
         Returns:
             int: The number of attempts used to solve the word (or 7 if failed).
         """
-        print(f"Wordle game started. Target word is: {self.grid.word}\n")
-        max_attempts: int = 6
+        if self.verbose:
+            print(f"Wordle game started. Target word is: {self.grid.word}\n")
+        max_attempts: int = MAX_ATTEMPTS
         attempts: int = 0
+        next_guess: Optional[str] = OPENING_GUESS
 
         while attempts < max_attempts:
-            print("\nCurrent Grid State:")
-            self.grid.print_domains()
+            if self.verbose:
+                print("\nCurrent Grid State:")
+                self.grid.print_domains()
 
             if self.grid.is_solved():
                 solved_word: str = ''.join(list(cell)[0] for cell in self.grid.get_cells())
-                print(f"Solved! The word is {solved_word} in {attempts} guesses.")
+                if self.verbose:
+                    print(f"Solved! The word is {solved_word} in {attempts} guesses.")
                 return attempts
 
-            if len(self.grid.allowed_words) == 0:
-                print("No possible words remain. The game has failed.")
+            if not self.grid.mask.any():
+                if self.verbose:
+                    print("No possible words remain. The game has failed.")
                 return 7
 
-            if attempts == 0:
-                guess: str = "salet"
+            last_candidate: bool = next_guess is None and np.count_nonzero(self.grid.mask) == 1
+            if next_guess is not None:
+                guess: str = next_guess
+            elif last_candidate:
+                guess = word_at(np.argmax(self.grid.mask))
             else:
-                guess = max(self.grid.allowed_words, key=self.rank_guess)
+                guess = best_guess(self.grid.mask)
+            next_guess = None
 
-            print(f"Bot's guess: {guess}")
+            if self.verbose:
+                print(f"Bot's guess: {guess}")
 
-            feedback: str = self.grid.feedback(guess)
-            print(f"Feedback: {feedback}")
+            feedback: int = self.grid.feedback(guess)
+            if self.verbose:
+                print(f"Feedback: {decode_feedback(feedback)}")
 
             attempts += 1
 
-            if feedback == "GGGGG":
-                print(f"Solved! The word is {guess} in {attempts} guesses.")
+            if feedback == ALL_GREEN:
+                if self.verbose:
+                    print(f"Solved! The word is {guess} in {attempts} guesses.")
                 return attempts
 
+            if last_candidate:
+                # The only consistent word was wrong, pruning would leave nothing
+                if self.verbose:
+                    print("No possible words remain. The game has failed.")
+                return 7
+
             self.grid.propagate_constraints(guess, feedback)
-            self.grid.prune_words()
+            opening: Optional[Tuple[str, np.ndarray]] = _OPENING_BOOK.get(feedback) if attempts == 1 else None
+            if opening is not None:
+                # Second guess and candidates after the opening are looked up rather than recomputed
+                next_guess, opening_mask = opening
+                self.grid.set_candidates(opening_mask)
+            else:
+                self.grid.prune_words(guess, feedback)
 
-        print(f"Game over! The bot failed to guess the word {self.grid.word} in {max_attempts} attempts.")
+        if self.verbose:
+            print(f"Game over! The bot failed to guess the word {self.grid.word} in {max_attempts} attempts.")
         return 7
     
 def solve_all_words() -> None:
     """
     Solve all words in the dataset and provide statistics.
+
+    The games are simulated together by simulate_all rather than by creating a WordleBot per word.
+    The reported time covers playing the games only, not the import-time feedback table and
+    opening book build or JIT compilation.
     """
-    df = pd.read_csv("data/possible_words.txt", header=None, dtype=str)
-    all_words: np.ndarray = df[0].values
-
-    total_words: int = 0
-    total_solved: int = 0
-    total_failed: int = 0
-    total_time: float = 0.0
-    total_guesses: int = 0
-
-    for w in all_words:
-        total_words += 1
-        start: float = time.time()
-        bot: WordleBot = WordleBot(target_word=w)
-        guesses: int = bot.play()
-        end: float = time.time()
-        elapsed: float = end - start
-        total_time += elapsed
-
-        total_guesses += guesses
-        if guesses <= 6:
-            total_solved += 1
-        else:
-            total_failed += 1
+    opening_row: np.ndarray = feedback_row(OPENING_GUESS)
+    opening_replies: np.ndarray = np.full(ALL_BLACK + 1, -1, dtype=np.int64)
+    for code, (reply, _) in _OPENING_BOOK.items():
+        opening_replies[code] = _WORD_INDEX[reply]
+
+    # Untimed run so that JIT compilation (on a cold Numba cache) is not counted as solving time
+    simulate_all(FEEDBACK_TABLE, _WORD_SCORES, opening_row, opening_replies)
+
+    start: float = time.time()
+    results: np.ndarray = simulate_all(FEEDBACK_TABLE, _WORD_SCORES, opening_row, opening_replies)
+    total_time: float = time.time() - start
+
+    total_words: int = len(results)
+    total_guesses: int = int(results.sum())
+    total_solved: int = int((results <= MAX_ATTEMPTS).sum())
+    total_failed: int = total_words - total_solved
 
     avg_time: float = total_time / total_words if total_words > 0 else 0.0
     avg_guesses: float = total_guesses / total_words if total_words > 0 else 0.0
@@ -290,7 +755,7 @@ def solve_all_words() -> None:
     print(f"Total Solved: {total_solved}")
     print(f"Total Failed: {total_failed}")
     print(f"Total Time: {total_time:.2f} seconds")
-    print(f"Average Time: {avg_time:.2f} seconds per word")
+    print(f"Average Time: {avg_time * 1000:.3f} ms per word")
     print(f"Average Guesses: {avg_guesses:.2f}")
 
 def solve_word(word: str) -> None:
@@ -300,7 +765,7 @@ def solve_word(word: str) -> None:
     Args:
         word (str): The word to solve.
     """
-    bot: WordleBot = WordleBot(target_word=word)
+    bot: WordleBot = WordleBot(target_word=word, verbose=True)
     bot.play()
 
 def main() -> None: